@@ -6,22 +6,29 @@ for extracurricular activities at Mergington High School.
 """
 
 from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, ORJSONResponse
+import asyncio
 import os
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import List
 
-from sqlalchemy import create_engine, Column, Integer, String, ForeignKey, UniqueConstraint, DateTime
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+from sqlalchemy import create_engine, event, select, insert, literal, func, text, lambda_stmt, bindparam, Column, Integer, String, ForeignKey, UniqueConstraint, DateTime, Index
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import declarative_base, relationship, sessionmaker, Session
+from sqlalchemy.pool import QueuePool
 from datetime import datetime, timedelta
 
 app = FastAPI(title="Mergington High School API",
-              description="API for viewing and signing up for extracurricular activities")
+              description="API for viewing and signing up for extracurricular activities",
+              default_response_class=ORJSONResponse)
 
 # Mount the static files directory
 current_dir = Path(__file__).parent
@@ -30,10 +37,56 @@ app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
 
 # --- Persistence (SQLite via SQLAlchemy) ---
 DB_PATH = os.path.join(current_dir, "activities.db")
-engine = create_engine(f"sqlite:///{DB_PATH}", connect_args={"check_same_thread": False})
+engine = create_engine(
+    f"sqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+)
+
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune SQLite for concurrent reads and cheap commits on every new connection.
+
+    WAL lets readers proceed while a write commits, and synchronous=NORMAL
+    drops the second fsync per commit (safe under WAL). Skipped for in-memory
+    databases, where journaling settings don't apply.
+    """
+    if DB_PATH == ":memory:":
+        return
+    cursor = dbapi_connection.cursor()
+    # auto_vacuum must be set before the first table is created to take effect
+    cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 Base = declarative_base()
 
+
+def get_db():
+    """Yield a request-scoped session, releasing it back to the pool afterwards.
+
+    The session is closed directly: FastAPI may run this generator's setup
+    and teardown on different threadpool threads, so thread-registry-scoped
+    cleanup would target the wrong session.
+    """
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
 # --- Audit Log Configuration ---
 # Privacy-aware settings: configure retention period (in days)
 AUDIT_LOG_RETENTION_DAYS = int(os.environ.get("AUDIT_LOG_RETENTION_DAYS", "90"))  # Default 90 days
@@ -60,26 +113,57 @@ class Participant(Base):
 
     __table_args__ = (
         UniqueConstraint("email", "activity_id", name="uq_participant_email_activity"),
+        # Covers the signup WHERE activity_id=? AND email=? and capacity-count lookups
+        Index("ix_participant_activity_email", "activity_id", "email"),
     )
 
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
+    # Filled by SQLite's CURRENT_TIMESTAMP (UTC); avoids a Python datetime per insert
+    timestamp = Column(DateTime, nullable=False, server_default=func.now())
     action = Column(String, nullable=False)  # signup, unregister, upload, check-in
     user_email = Column(String, nullable=False)
     activity_name = Column(String, nullable=True)
     details = Column(String, nullable=True)
     ip_address = Column(String, nullable=True)
 
+    __table_args__ = (
+        # timestamp serves the ORDER BY ... DESC page fetch and the retention DELETE;
+        # action serves the stats GROUP BY
+        Index("ix_audit_logs_timestamp", timestamp.desc()),
+        Index("ix_audit_logs_action", action),
+    )
+
+
+# Statements for the per-request lookups, compiled once per process via the
+# lambda statement cache; parameters are bound into the cached SQL at execute time
+_activity_by_name = lambda_stmt(
+    lambda: select(Activity).where(Activity.name == bindparam("name"))
+)
+_participant_by_activity_email = lambda_stmt(
+    lambda: select(Participant).where(
+        Participant.activity_id == bindparam("activity_id"),
+        Participant.email == bindparam("email"),
+    )
+)
+
 
 def init_db():
     Base.metadata.create_all(bind=engine)
+    # create_all skips tables that already exist, so backfill the indexes
+    # on databases created before they were declared
+    with engine.connect() as conn:
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_participant_activity_email ON participants (activity_id, email)"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_audit_logs_timestamp ON audit_logs (timestamp DESC)"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_audit_logs_action ON audit_logs (action)"))
+        conn.commit()
     # Seed initial activities if empty
     db = SessionLocal()
     try:
-        if db.query(Activity).count() == 0:
+        # Existence probe: first-row lookup instead of a full COUNT(*)
+        if db.execute(select(Activity.id).limit(1)).first() is None:
             seed_data = [
                 ("Chess Club", "Learn strategies and compete in chess tournaments", "Fridays, 3:30 PM - 5:00 PM", 12,
                  ["michael@mergington.edu", "daniel@mergington.edu"]),
@@ -102,12 +186,19 @@ def init_db():
                 ("Manga Maniacs", "Explore the fantastic stories of the most peculiar characters from Japanese Manga (graphic novels).", "Tuesdays, 7:00 PM - 8:00 PM", 15,
                  []),
             ]
-            for name, description, schedule, maxp, emails in seed_data:
-                act = Activity(name=name, description=description, schedule=schedule, max_participants=maxp)
-                db.add(act)
-                db.flush()
-                for email in emails:
-                    db.add(Participant(email=email, activity_id=act.id))
+            db.bulk_insert_mappings(Activity, [
+                {"name": name, "description": description, "schedule": schedule, "max_participants": maxp}
+                for name, description, schedule, maxp, _ in seed_data
+            ])
+            id_for = dict(db.execute(select(Activity.name, Activity.id)).all())
+            # One executemany instead of a per-row add for every seed participant
+            participants = [
+                {"email": email, "activity_id": id_for[name]}
+                for name, _, _, _, emails in seed_data
+                for email in emails
+            ]
+            if participants:
+                db.execute(insert(Participant), participants)
             db.commit()
     finally:
         db.close()
@@ -128,9 +219,8 @@ def get_client_ip(request: Request) -> str:
 
 
 def log_audit_event(db, action: str, user_email: str, activity_name: str = None, details: str = None, ip_address: str = None):
-    """Create an audit log entry"""
+    """Add an audit log entry to the session; the caller's commit persists it"""
     audit_log = AuditLog(
-        timestamp=datetime.utcnow(),
         action=action,
         user_email=user_email,
         activity_name=activity_name,
@@ -138,44 +228,48 @@ def log_audit_event(db, action: str, user_email: str, activity_name: str = None,
         ip_address=ip_address
     )
     db.add(audit_log)
-    db.commit()
 
 
 def cleanup_old_audit_logs():
     """Remove audit logs older than the retention period"""
     if AUDIT_LOG_RETENTION_DAYS <= 0:
         return 0  # Retention disabled
-    
+
     db = SessionLocal()
     try:
         cutoff_date = datetime.utcnow() - timedelta(days=AUDIT_LOG_RETENTION_DAYS)
         deleted = db.query(AuditLog).filter(AuditLog.timestamp < cutoff_date).delete()
         db.commit()
+        if deleted:
+            # Hand freed pages back without a blocking full VACUUM
+            db.execute(text("PRAGMA incremental_vacuum"))
+            db.commit()
         return deleted
     finally:
         db.close()
 
 
-# Track last cleanup time to avoid running on every request
-_last_cleanup_time = None
-_CLEANUP_INTERVAL_HOURS = 24
+_CLEANUP_INTERVAL_SECONDS = 24 * 60 * 60
+
+# Module-level handle: the event loop only holds weak references to tasks,
+# so an unreferenced cleanup loop could be garbage-collected mid-sleep
+_cleanup_task = None
 
 
-def should_run_cleanup():
-    """Check if cleanup should run based on time since last cleanup"""
-    global _last_cleanup_time
-    if _last_cleanup_time is None:
-        return True
-    elapsed = datetime.utcnow() - _last_cleanup_time
-    return elapsed > timedelta(hours=_CLEANUP_INTERVAL_HOURS)
+@app.on_event("startup")
+async def start_audit_log_cleanup():
+    """Run retention cleanup once a day in the background.
 
+    Keeps the potentially large DELETE off the request path so admin
+    reads aren't coupled to retention workload.
+    """
+    async def _cleanup_loop():
+        while True:
+            await run_in_threadpool(cleanup_old_audit_logs)
+            await asyncio.sleep(_CLEANUP_INTERVAL_SECONDS)
 
-def maybe_cleanup_audit_logs():
-    """Run cleanup only if enough time has passed"""
-    global _last_cleanup_time
-    if should_run_cleanup():
-        cleanup_old_audit_logs()
-        _last_cleanup_time = datetime.utcnow()
+    global _cleanup_task
+    _cleanup_task = asyncio.create_task(_cleanup_loop())
 
 
 # --- Minimal Auth & Roles ---
@@ -191,12 +285,20 @@ TOKENS = {
     "admin-token-xyz": "admin",
 }
 
+# Reverse lookup for login; if a role ever maps to several tokens, the last wins
+ROLE_TO_TOKEN = {r: t for t, r in TOKENS.items()}
+
+
+@lru_cache(maxsize=1024)
+def _role_for(token: str):
+    """Resolve a bearer token to a role; bounded LRU so repeat tokens short-circuit"""
+    return TOKENS.get(token)
+
 
 def get_current_role(creds: HTTPAuthorizationCredentials = Depends(security)):
     if not creds:
         return None
-    token = creds.credentials
-    return TOKENS.get(token)
+    return _role_for(creds.credentials)
 
 
 @app.post("/login")
@@ -205,10 +307,10 @@ def login(username: str, role: str):
     if role not in {"student", "organizer", "admin"}:
         raise HTTPException(status_code=400, detail="Invalid role")
     # In a real system, verify username/password and issue JWT.
-    for t, r in TOKENS.items():
-        if r == role:
-            return {"token": t, "role": r}
-    raise HTTPException(status_code=500, detail="No token configured for role")
+    token = ROLE_TO_TOKEN.get(role)
+    if token is None:
+        raise HTTPException(status_code=500, detail="No token configured for role")
+    return {"token": token, "role": role}
 
 
 @app.get("/")
@@ -216,108 +318,156 @@ def root():
     return RedirectResponse(url="/static/index.html")
 
 
+# The /activities payload only changes on signup/unregister, so cache the
+# built dict per process, invalidated by a version counter bumped on each
+# write. The counter is process-local: under uvicorn --workers, a write
+# handled by one worker is invisible to the others' counters, so a short TTL
+# bounds how long any worker can serve a payload it didn't see change.
+_activities_version = 0
+_activities_cache = {"version": -1, "payload": None, "at": 0.0}
+_ACTIVITIES_CACHE_TTL_SECONDS = 2
+
+
+def bump_activities_version():
+    global _activities_version
+    _activities_version += 1
+
+
 @app.get("/activities")
-def get_activities():
-    db = SessionLocal()
-    try:
-        result = {}
-        acts = db.query(Activity).all()
-        for a in acts:
-            result[a.name] = {
-                "description": a.description,
-                "schedule": a.schedule,
-                "max_participants": a.max_participants,
-                "participants": [p.email for p in a.participants]
-            }
-        return result
-    finally:
-        db.close()
+def get_activities(db: Session = Depends(get_db)):
+    # Capture the version before querying: if a write bumps it mid-rebuild,
+    # the stored entry stays stale-marked and the next read rebuilds again
+    version = _activities_version
+    if (_activities_cache["version"] == version
+            and time.monotonic() - _activities_cache["at"] < _ACTIVITIES_CACHE_TTL_SECONDS):
+        return _activities_cache["payload"]
+    # Select just the columns we serialize: one JOIN, no ORM instance hydration
+    rows = db.execute(
+        select(Activity.name, Activity.description, Activity.schedule,
+               Activity.max_participants, Participant.email)
+        .outerjoin(Participant, Participant.activity_id == Activity.id)
+        .order_by(Activity.id, Participant.id)
+    ).all()
+    result = {}
+    for name, description, schedule, max_participants, email in rows:
+        entry = result.setdefault(name, {
+            "description": description,
+            "schedule": schedule,
+            "max_participants": max_participants,
+            "participants": []
+        })
+        if email is not None:
+            entry["participants"].append(email)
+    _activities_cache["payload"] = result
+    _activities_cache["version"] = version
+    _activities_cache["at"] = time.monotonic()
+    return result
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str, request: Request, role: str | None = Depends(get_current_role)):
+def signup_for_activity(activity_name: str, email: str, request: Request, role: str | None = Depends(get_current_role), db: Session = Depends(get_db)):
     """Sign up a student for an activity"""
     # If auth provided, ensure role is student
     if role and role != "student":
         raise HTTPException(status_code=403, detail="Only students can sign up")
-    db = SessionLocal()
+    # One atomic INSERT ... SELECT: the capacity check runs inside the statement
+    # and the unique constraint rejects duplicate signups, so there is no
+    # check-then-insert race and no extra SELECT round trips.
+    current_count = (
+        select(func.count(Participant.id))
+        .where(Participant.activity_id == Activity.id)
+        .scalar_subquery()
+    )
+    stmt = insert(Participant).from_select(
+        ["email", "activity_id"],
+        select(literal(email), Activity.id).where(
+            Activity.name == activity_name,
+            current_count < Activity.max_participants,
+        ),
+    )
     try:
-        act = db.query(Activity).filter(Activity.name == activity_name).first()
-        if not act:
+        result = db.execute(stmt)
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Student is already signed up")
+
+    if result.rowcount == 0:
+        # Nothing inserted: distinguish unknown activity from a full one
+        if db.execute(_activity_by_name, {"name": activity_name}).first() is None:
             raise HTTPException(status_code=404, detail="Activity not found")
+        raise HTTPException(status_code=400, detail="Activity is at full capacity")
 
-        # Check already signed up
-        exists = db.query(Participant).filter(Participant.activity_id == act.id, Participant.email == email).first()
-        if exists:
-            raise HTTPException(status_code=400, detail="Student is already signed up")
-
-        # Enforce capacity
-        current_count = db.query(Participant).filter(Participant.activity_id == act.id).count()
-        if current_count >= act.max_participants:
-            raise HTTPException(status_code=400, detail="Activity is at full capacity")
+    # Audit entry rides in the same transaction: one commit, one fsync
+    log_audit_event(db, "signup", email, activity_name, f"Student signed up for {activity_name}", get_client_ip(request))
+    db.commit()
+    bump_activities_version()
 
-        db.add(Participant(email=email, activity_id=act.id))
-        db.commit()
-        
-        # Log the audit event with IP address
-        log_audit_event(db, "signup", email, activity_name, f"Student signed up for {activity_name}", get_client_ip(request))
-        
-        return {"message": f"Signed up {email} for {activity_name}"}
-    finally:
-        db.close()
+    return {"message": f"Signed up {email} for {activity_name}"}
 
 
 @app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str, request: Request, role: str | None = Depends(get_current_role)):
+def unregister_from_activity(activity_name: str, email: str, request: Request, role: str | None = Depends(get_current_role), db: Session = Depends(get_db)):
     """Unregister a student from an activity"""
     # If auth provided, ensure role is organizer (management action)
     if role and role != "organizer":
         raise HTTPException(status_code=403, detail="Only organizers can manage registrations")
-    db = SessionLocal()
-    try:
-        act = db.query(Activity).filter(Activity.name == activity_name).first()
-        if not act:
-            raise HTTPException(status_code=404, detail="Activity not found")
+    act = db.execute(_activity_by_name, {"name": activity_name}).scalar_one_or_none()
+    if not act:
+        raise HTTPException(status_code=404, detail="Activity not found")
 
-        part = db.query(Participant).filter(Participant.activity_id == act.id, Participant.email == email).first()
-        if not part:
-            raise HTTPException(status_code=400, detail="Student is not signed up for this activity")
+    part = db.execute(_participant_by_activity_email, {"activity_id": act.id, "email": email}).scalar_one_or_none()
+    if not part:
+        raise HTTPException(status_code=400, detail="Student is not signed up for this activity")
 
-        db.delete(part)
-        db.commit()
-        
-        # Log the audit event with IP address
-        log_audit_event(db, "unregister", email, activity_name, f"Student unregistered from {activity_name}", get_client_ip(request))
-        
-        return {"message": f"Unregistered {email} from {activity_name}"}
-    finally:
-        db.close()
+    db.delete(part)
+    # Audit entry rides in the same transaction: one commit, one fsync
+    log_audit_event(db, "unregister", email, activity_name, f"Student unregistered from {activity_name}", get_client_ip(request))
+    db.commit()
+    bump_activities_version()
+
+    return {"message": f"Unregistered {email} from {activity_name}"}
 
 
 # --- Admin Endpoints ---
+# COUNT(*) over the whole log is only shown for the pagination display,
+# so serve it from a short-lived cache instead of recounting per page
+_log_count_cache = {"total": 0, "at": 0.0}
+_LOG_COUNT_CACHE_SECONDS = 60
+
+
+def get_cached_log_count(db):
+    now = time.monotonic()
+    if now - _log_count_cache["at"] > _LOG_COUNT_CACHE_SECONDS:
+        _log_count_cache["total"] = db.query(AuditLog).count()
+        _log_count_cache["at"] = now
+    return _log_count_cache["total"]
+
+
 @app.get("/admin/audit-logs")
-def get_audit_logs(role: str | None = Depends(get_current_role), limit: int = 100, offset: int = 0):
-    """Get audit logs - admin only"""
+async def get_audit_logs(role: str | None = Depends(get_current_role), limit: int = 100, before_id: int | None = None, db: Session = Depends(get_db)):
+    """Get audit logs - admin only, keyset-paginated newest first"""
     if role != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
-    
-    db = SessionLocal()
-    try:
-        # Clean up old logs periodically (not on every request)
-        maybe_cleanup_audit_logs()
-        
-        # Get logs with pagination
-        logs = db.query(AuditLog).order_by(AuditLog.timestamp.desc()).limit(limit).offset(offset).all()
-        total = db.query(AuditLog).count()
-        
+
+    def fetch_page():
+        # Keyset pagination on id: seek directly to the cursor instead of
+        # walking OFFSET rows on every page. The monotonic integer id gives
+        # the same newest-first order as the server-filled timestamp but has
+        # no ties at one-second resolution and no text-comparison pitfalls.
+        q = db.query(AuditLog).order_by(AuditLog.id.desc())
+        if before_id is not None:
+            q = q.filter(AuditLog.id < before_id)
+        logs = q.limit(limit).all()
+
+        # orjson serializes datetimes natively, so no per-row isoformat() calls
         return {
-            "total": total,
+            "total": get_cached_log_count(db),
             "limit": limit,
-            "offset": offset,
+            "next_before_id": logs[-1].id if logs else None,
             "logs": [
                 {
                     "id": log.id,
-                    "timestamp": log.timestamp.isoformat(),
+                    "timestamp": log.timestamp,
                     "action": log.action,
                     "user_email": log.user_email,
                     "activity_name": log.activity_name,
@@ -327,78 +477,89 @@ def get_audit_logs(role: str | None = Depends(get_current_role), limit: int = 10
                 for log in logs
             ]
         }
-    finally:
-        db.close()
+
+    # Table-scanning query: keep it off the event loop
+    return await run_in_threadpool(fetch_page)
 
 
 @app.get("/admin/audit-logs/export")
-def export_audit_logs(role: str | None = Depends(get_current_role)):
-    """Export audit logs as CSV - admin only"""
+async def export_audit_logs(role: str | None = Depends(get_current_role)):
+    """Export audit logs as CSV - admin only, streamed row by row
+
+    Declared async so the handler itself never occupies a threadpool
+    slot; the sync generator below is iterated by StreamingResponse in
+    the threadpool, keeping the full-table scan off the event loop.
+    """
     if role != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
-    
+
     from fastapi.responses import StreamingResponse
     import io
     import csv
-    
-    db = SessionLocal()
-    try:
-        logs = db.query(AuditLog).order_by(AuditLog.timestamp.desc()).all()
-        
-        # Create CSV in memory
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow(["ID", "Timestamp", "Action", "User Email", "Activity Name", "Details", "IP Address"])
-        
-        # Write data
-        for log in logs:
-            writer.writerow([
-                log.id,
-                log.timestamp.isoformat(),
-                log.action,
-                log.user_email,
-                log.activity_name or "",
-                log.details or "",
-                log.ip_address or ""
-            ])
-        
-        output.seek(0)
-        
-        return StreamingResponse(
-            iter([output.getvalue()]),
-            media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=audit_logs.csv"}
-        )
-    finally:
-        db.close()
+
+    def generate_csv():
+        # The generator outlives the request handler, so it owns its session
+        db = SessionLocal()
+        try:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+
+            def flush_row(row):
+                writer.writerow(row)
+                chunk = buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+                return chunk
+
+            yield flush_row(["ID", "Timestamp", "Action", "User Email", "Activity Name", "Details", "IP Address"])
+
+            # Column tuples fetched in server-side batches: no ORM hydration
+            # and memory stays constant regardless of table size
+            rows = db.execute(
+                select(AuditLog.id, AuditLog.timestamp, AuditLog.action,
+                       AuditLog.user_email, AuditLog.activity_name,
+                       AuditLog.details, AuditLog.ip_address)
+                .order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
+            ).yield_per(1000)
+            for log_id, timestamp, action, user_email, activity_name, details, ip_address in rows:
+                yield flush_row([
+                    log_id,
+                    timestamp.isoformat(),
+                    action,
+                    user_email,
+                    activity_name or "",
+                    details or "",
+                    ip_address or ""
+                ])
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        generate_csv(),
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=audit_logs.csv"}
+    )
 
 
 @app.get("/admin/audit-logs/stats")
-def get_audit_stats(role: str | None = Depends(get_current_role)):
+def get_audit_stats(role: str | None = Depends(get_current_role), db: Session = Depends(get_db)):
     """Get audit log statistics - admin only"""
     if role != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
-    
-    db = SessionLocal()
-    try:
-        total_logs = db.query(AuditLog).count()
-        
-        # Count by action type
-        from sqlalchemy import func
-        action_counts = db.query(AuditLog.action, func.count(AuditLog.id)).group_by(AuditLog.action).all()
-        
-        # Get date range
-        oldest_log = db.query(AuditLog).order_by(AuditLog.timestamp.asc()).first()
-        newest_log = db.query(AuditLog).order_by(AuditLog.timestamp.desc()).first()
-        
-        return {
-            "total_logs": total_logs,
-            "action_counts": {action: count for action, count in action_counts},
-            "retention_days": AUDIT_LOG_RETENTION_DAYS,
-            "oldest_log": oldest_log.timestamp.isoformat() if oldest_log else None,
-            "newest_log": newest_log.timestamp.isoformat() if newest_log else None
-        }
-    finally:
-        db.close()
+
+    # One aggregate pass for the date range and total; MIN/MAX are single
+    # B-tree seeks on the timestamp index
+    oldest, newest, total_logs = db.execute(
+        select(func.min(AuditLog.timestamp), func.max(AuditLog.timestamp), func.count(AuditLog.id))
+    ).one()
+
+    # Count by action type
+    action_counts = db.query(AuditLog.action, func.count(AuditLog.id)).group_by(AuditLog.action).all()
+
+    return {
+        "total_logs": total_logs,
+        "action_counts": {action: count for action, count in action_counts},
+        "retention_days": AUDIT_LOG_RETENTION_DAYS,
+        "oldest_log": oldest,
+        "newest_log": newest
+    }
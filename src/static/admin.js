@@ -1,5 +1,7 @@
 let adminToken = null;
 let currentPage = 1;
+// Keyset cursors: cursorStack[i - 1] is the "before_id" cursor for page i
+let cursorStack = [null];
 const logsPerPage = 50;
 
 document.addEventListener("DOMContentLoaded", () => {
@@ -14,7 +16,11 @@ document.addEventListener("DOMContentLoaded", () => {
 
   // Setup event listeners
   document.getElementById("auth-form").addEventListener("submit", handleAuth);
-  document.getElementById("refresh-btn").addEventListener("click", loadAuditLogs);
+  document.getElementById("refresh-btn").addEventListener("click", () => {
+    currentPage = 1;
+    cursorStack = [null];
+    loadAuditLogs();
+  });
   document.getElementById("prev-btn").addEventListener("click", () => {
     if (currentPage > 1) {
       currentPage--;
@@ -158,9 +164,10 @@ async function loadAuditLogs() {
   const nextBtn = document.getElementById("next-btn");
 
   try {
-    const offset = (currentPage - 1) * logsPerPage;
+    const beforeId = cursorStack[currentPage - 1];
+    const beforeParam = beforeId ? `&before_id=${beforeId}` : "";
     const response = await fetch(
-      `/admin/audit-logs?limit=${logsPerPage}&offset=${offset}`,
+      `/admin/audit-logs?limit=${logsPerPage}${beforeParam}`,
       {
         headers: {
           Authorization: `Bearer ${adminToken}`,
@@ -198,6 +205,9 @@ async function loadAuditLogs() {
       });
     }
 
+    // Remember the cursor for the following page
+    cursorStack[currentPage] = data.next_before_id;
+
     // Update pagination
     const totalPages = Math.ceil(data.total / logsPerPage);
     pageInfo.textContent = `Page ${currentPage} of ${totalPages}`;